@@ -1,13 +1,34 @@
 # app.py
 import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 from typing import List, Dict
-import random
+import numpy as np
+import pandas as pd
 
 # ---- bring in your engine & data (must be in same folder) ----
-from nba_draft_sim import (
-    Player, Team, POSITIONS, PLAYER_DB,
-    list_by_position, simulate_game
-)
+@st.cache_resource(show_spinner=False)
+def _engine() -> SimpleNamespace:
+    # app.py re-executes on every rerun, so the engine handles and the lookup
+    # tables derived from PLAYER_DB are built here once per server process
+    from nba_draft_sim import (
+        Player, Team, POSITIONS, PLAYER_DB,
+        simulate_game, STAT_IDX, POS_INDEX, AUTO_SCORE
+    )
+
+    return SimpleNamespace(
+        Player=Player, Team=Team, POSITIONS=POSITIONS, PLAYER_DB=PLAYER_DB,
+        simulate_game=simulate_game, STAT_IDX=STAT_IDX,
+        # the engine scores every player once at import (same score as its auto-draft),
+        # so look scores up by index into PLAYER_DB instead of re-summing the dict
+        OVERALL=AUTO_SCORE,
+        # position -> indices (into PLAYER_DB) of everyone eligible there, primary or secondary
+        POS_IDX={pos: np.array(ids, dtype=np.intp) for pos, ids in POS_INDEX.items()},
+    )
+
+E = _engine()
+Player, Team, POSITIONS, PLAYER_DB = E.Player, E.Team, E.POSITIONS, E.PLAYER_DB
+_OVERALL, POS_IDX = E.OVERALL, E.POS_IDX
 
 st.set_page_config(page_title="NBA Top-75 Draft & Game Simulator", layout="wide")
 st.title("🏀 NBA Top-75 Draft & Game Simulator")
@@ -19,21 +40,27 @@ def _rerun():
     else:  # older versions
         st.experimental_rerun()
 
+# st.fragment graduated from st.experimental_fragment in 1.37
+_fragment = getattr(st, "fragment", None) or st.experimental_fragment
+
 # ----------------------------- Helpers -----------------------------
-def overall_score(p: Player) -> float:
-    r = p.ratings
-    return r['finishing'] + r['three'] + r['mid'] + r['playmaking'] + r['per_def'] + r['int_def'] + 0.5*r['rebounding']
+@st.cache_resource
+def _label_cache() -> Dict[int, str]:
+    # app.py re-executes on every rerun, so a bare module-level dict would start
+    # empty each time; a cached resource survives for the life of the server
+    return {}
 
-def player_label(p: Player) -> str:
-    return f"{p.name} • {p.pos_primary}  |  {p.ppg:.1f} PPG, 3P {int(p.three_pct*100)}%, TS {p.ts:.3f}"
+_LABEL_CACHE = _label_cache()
 
-def pool_for_position(pool: List[Player], pos: str) -> List[Player]:
-    cands = [p for p in pool if (p.pos_primary == pos or pos in p.pos_secondary)]
-    return sorted(cands, key=overall_score, reverse=True)
+def player_label(p: Player) -> str:
+    s = _LABEL_CACHE.get(id(p))
+    if s is None:
+        s = f"{p.name} • {p.pos_primary}  |  {p.ppg:.1f} PPG, 3P {int(p.three_pct*100)}%, TS {p.ts:.3f}"
+        _LABEL_CACHE[id(p)] = s
+    return s
 
 def render_bars(title: str, syn: Dict[str, float]):
     st.subheader(title)
-    cols = st.columns(7)
     keys = [
         ("spacing", "Spacing"),
         ("rim_pressure", "Rim"),
@@ -43,48 +70,46 @@ def render_bars(title: str, syn: Dict[str, float]):
         ("rebounding", "Reb"),
         ("pace", "Pace"),
     ]
-    for i, (k, label) in enumerate(keys):
-        with cols[i]:
-            val = syn[k]
-            if k == "pace":
-                pct = max(0, min(100, (val - 90) * (100 / (104 - 90))))  # normalize pace 90–104 to 0–100
-            else:
-                pct = max(0, min(100, val))  # synergy is already ~0–100
-            st.markdown(f"**{label}**")
-            st.progress(int(pct), text=f"{val:.1f}")
-
-def team_box_rows(team: Team, result: Dict):
-    rows = []
-    for p in team.all_players():
-        r = result['box'].get(p.name, {})
-        rows.append({
-            "Player": p.name,
-            "PTS": r.get('pts',0),
-            "FG": f"{r.get('fgm',0)}-{r.get('fga',0)}",
-            "FT": f"{r.get('ftm',0)}-{r.get('fta',0)}",
-            "AST": r.get('ast',0),
-            "REB": r.get('orb',0)+r.get('drb',0),
-            "ORB": r.get('orb',0),
-            "DRB": r.get('drb',0),
-        })
-    return rows
-
-def build_team(name: str, picks: Dict[str, Player]) -> Team:
-    return Team(name=name, lineup=picks)
-
-def _clear_pick_options_cache():
-    for k in list(st.session_state.keys()):
-        if isinstance(k, str) and k.startswith("opts_r"):
-            del st.session_state[k]
+    pcts = [
+        max(0, min(100, (syn[k] - 90) * (100 / (104 - 90)))) if k == "pace"  # normalize pace 90–104 to 0–100
+        else max(0, min(100, syn[k]))  # synergy is already ~0–100
+        for k, _ in keys
+    ]
+    # one markdown block for all seven bars instead of 7 columns x (markdown + progress)
+    cells = "".join(
+        f'<div style="flex:1;min-width:0"><b>{label}</b><br>'
+        f'<progress value="{int(pct)}" max="100" style="width:100%"></progress>'
+        f'<div style="font-size:0.85em">{syn[k]:.1f}</div></div>'
+        for (k, label), pct in zip(keys, pcts)
+    )
+    st.markdown(f'<div style="display:flex;gap:0.75rem">{cells}</div>', unsafe_allow_html=True)
+
+def team_box_rows(team: Team, rows: np.ndarray) -> pd.DataFrame:
+    # rows: this team's (5, n_stats) slice of result['box'], in lineup order
+    names = [p.name for p in team.all_players()]
+    pts, fgm, fga, ftm, fta, ast, orb, drb = (rows[:, E.STAT_IDX[k]] for k in ('pts','fgm','fga','ftm','fta','ast','orb','drb'))
+    return pd.DataFrame({
+        "Player": names,
+        "PTS": pts,
+        "FG": [f"{m}-{a}" for m, a in zip(fgm, fga)],
+        "FT": [f"{m}-{a}" for m, a in zip(ftm, fta)],
+        "AST": ast,
+        "REB": orb + drb,
+        "ORB": orb,
+        "DRB": drb,
+    })
 
 # ----------------------------- State init -----------------------------
-if "pool" not in st.session_state:
-    st.session_state.pool = PLAYER_DB.copy()
+if "pool_mask" not in st.session_state:
+    st.session_state.pool_mask = np.ones(len(PLAYER_DB), dtype=bool)  # undrafted players, by PLAYER_DB index
+
+if "teams" not in st.session_state:
+    st.session_state.teams = {name: {pos: None for pos in POSITIONS} for name in ("Team A", "Team B")}
 
-if "team_a" not in st.session_state:
-    st.session_state.team_a = {pos: None for pos in POSITIONS}
-if "team_b" not in st.session_state:
-    st.session_state.team_b = {pos: None for pos in POSITIONS}
+if "filled_a" not in st.session_state:
+    st.session_state.filled_a = 0  # positions filled, kept in step with teams
+if "filled_b" not in st.session_state:
+    st.session_state.filled_b = 0
 
 if "draft_round" not in st.session_state:
     st.session_state.draft_round = 1  # 1..5
@@ -92,27 +117,50 @@ if "draft_index" not in st.session_state:
     st.session_state.draft_index = 0  # 0 or 1 within a round
 if "history" not in st.session_state:
     st.session_state.history = []  # stack of (team, pos, player)
+if "opts" not in st.session_state:
+    st.session_state.opts = {}  # (round, index, team) -> {pos: shown options}
+if "best_for_pos" not in st.session_state:
+    st.session_state.best_for_pos = {}  # pos -> best available Player, filled lazily
 
 def reset_all():
-    st.session_state.pool = PLAYER_DB.copy()
-    st.session_state.team_a = {pos: None for pos in POSITIONS}
-    st.session_state.team_b = {pos: None for pos in POSITIONS}
+    st.session_state.pool_mask = np.ones(len(PLAYER_DB), dtype=bool)
+    st.session_state.teams = {name: {pos: None for pos in POSITIONS} for name in ("Team A", "Team B")}
+    st.session_state.filled_a = 0
+    st.session_state.filled_b = 0
     st.session_state.draft_round = 1
     st.session_state.draft_index = 0
     st.session_state.history = []
     st.session_state.seed = ""
-    _clear_pick_options_cache()
+    st.session_state.rng = np.random.default_rng()
+    st.session_state.rng_seed = None
+    st.session_state.opts = {}
+    st.session_state.best_for_pos = {}
 
 # ----------------------------- Sidebar controls -----------------------------
+# (seed or None, warning or None)
+def _parse_seed(s: str):
+    s = s.strip()
+    if not s:
+        return None, None
+    digits = s[1:] if s[0] in "+-" else s
+    if digits.isdecimal():
+        return int(s), None
+    return None, "Seed must be an integer."
+
 st.sidebar.header("Settings")
 seed_in = st.sidebar.text_input("Random seed (optional)", value=st.session_state.get("seed",""))
-try:
-    seed_val = int(seed_in) if seed_in.strip() else None
-except:
-    seed_val = None
-    st.sidebar.warning("Seed must be an integer.")
+seed_val, seed_warning = _parse_seed(seed_in)
+if seed_warning:
+    st.sidebar.warning(seed_warning)
 st.session_state.seed = seed_in
 
+# one generator per session, reseeded whenever the seed changes, so option
+# draws replay for a given seed
+if "rng" not in st.session_state or st.session_state.rng_seed != seed_val:
+    # SeedSequence rejects negative ints, which the seed box accepts
+    st.session_state.rng = np.random.default_rng(None if seed_val is None else seed_val % 2**64)
+    st.session_state.rng_seed = seed_val
+
 if st.sidebar.button("🔄 Reset Draft"):
     reset_all()
     _rerun()
@@ -127,8 +175,12 @@ def current_team_name() -> str:
     else:            # even round: B then A
         return "Team B" if idx == 0 else "Team A"
 
+def _slot() -> tuple:
+    # the pick currently on the clock; keys st.session_state.opts
+    return (st.session_state.draft_round, st.session_state.draft_index, current_team_name())
+
 def team_dict(name: str) -> Dict[str, Player]:
-    return st.session_state.team_a if name == "Team A" else st.session_state.team_b
+    return st.session_state.teams[name]
 
 def unfilled_positions(name: str) -> List[str]:
     t = team_dict(name)
@@ -136,8 +188,10 @@ def unfilled_positions(name: str) -> List[str]:
 
 def make_pick(team_name: str, pos: str, player: Player):
     team_dict(team_name)[pos] = player
-    st.session_state.pool = [p for p in st.session_state.pool if p.name != player.name]
+    st.session_state[f"filled_{team_name[-1].lower()}"] += 1
+    st.session_state.pool_mask[player.idx] = False
     st.session_state.history.append((team_name, pos, player))
+    st.session_state.opts.pop(_slot(), None)  # this slot is done; nothing else is stale
 
     # advance pointer
     if st.session_state.draft_index == 0:
@@ -146,12 +200,14 @@ def make_pick(team_name: str, pos: str, player: Player):
         st.session_state.draft_index = 0
         st.session_state.draft_round += 1
 
-    _clear_pick_options_cache()
+    st.session_state.best_for_pos = {}
 
 def undo_last():
     if not st.session_state.history:
         return
     team_name, pos, player = st.session_state.history.pop()
+    # options drawn for the slot on the clock may include players that the redone pick takes
+    st.session_state.opts.pop(_slot(), None)
     # step pointer back
     if st.session_state.draft_index == 1:
         st.session_state.draft_index = 0
@@ -160,99 +216,107 @@ def undo_last():
         st.session_state.draft_round = max(1, st.session_state.draft_round - 1)
     # restore
     team_dict(team_name)[pos] = None
-    st.session_state.pool.append(player)
-    _clear_pick_options_cache()
+    st.session_state[f"filled_{team_name[-1].lower()}"] -= 1
+    st.session_state.pool_mask[player.idx] = True
+    st.session_state.best_for_pos = {}
+
+def best_available(pos: str) -> Player | None:
+    # computed on first ask after each pick/undo, then reused until the pool changes
+    best = st.session_state.best_for_pos
+    if pos not in best:
+        ids = POS_IDX[pos][st.session_state.pool_mask[POS_IDX[pos]]]
+        best[pos] = PLAYER_DB[ids[_OVERALL[ids].argmax()]] if len(ids) else None
+    return best[pos]
 
 # ----------------------------- Draft UI -----------------------------
+def _reshuffle_options(slot: tuple, pos: str):
+    # sample straight from the index array instead of materialising a Player list
+    idxs = POS_IDX[pos][st.session_state.pool_mask[POS_IDX[pos]]]
+    choice = st.session_state.rng.choice(idxs, size=min(5, len(idxs)), replace=False)
+    st.session_state.opts.setdefault(slot, {})[pos] = [PLAYER_DB[i] for i in choice]
+
+# Only the picker reruns on its own widget interactions (position change,
+# reshuffle); picks and undo still call _rerun() to refresh the lineups.
+@_fragment
+def _draft_picker():
+    team_name = current_team_name()
+    st.markdown(f"**Round {st.session_state.draft_round}** · **{team_name}** is on the clock")
+
+    positions_remaining = unfilled_positions(team_name)
+    pos_choice = st.selectbox("Choose position", options=positions_remaining, key="draft_pos")
+
+    # create a stable 5-option list for the CURRENT pick (sample from ALL candidates)
+    slot = _slot()
+    if pos_choice not in st.session_state.opts.get(slot, {}):
+        _reshuffle_options(slot, pos_choice)
+    shown = st.session_state.opts[slot][pos_choice]
+
+    # Optional reshuffle button (resampled in the callback, before the fragment reruns)
+    st.button("🎲 Reshuffle options", on_click=_reshuffle_options, args=(slot, pos_choice))
+
+    # options are PLAYER_DB indices: widget values come back as deep copies,
+    # so a Player returned by the selectbox would not be found by identity
+    pick_idx = st.selectbox(
+        "Pick player",
+        options=[p.idx for p in shown],
+        format_func=lambda i: player_label(PLAYER_DB[i]),
+        key="draft_player"
+    )
+    pick_choice = PLAYER_DB[pick_idx] if pick_idx is not None else None
+
+    draft_cols = st.columns([1,1,1])
+    with draft_cols[0]:
+        if st.button("✅ Make Pick"):
+            make_pick(team_name, pos_choice, pick_choice)
+            _rerun()
+    with draft_cols[1]:
+        if st.button("🤖 Auto-Pick (Best)"):
+            best = best_available(pos_choice)
+            if best is not None:
+                make_pick(team_name, pos_choice, best)
+                _rerun()
+    with draft_cols[2]:
+        if st.button("↩️ Undo Last Pick", disabled=len(st.session_state.history)==0):
+            undo_last()
+            _rerun()
+
 col_left, col_right = st.columns([1,2], gap="large")
 
 with col_left:
     st.subheader("🧢 Draft — On the Clock")
     if st.session_state.draft_round <= 5:
-        team_name = current_team_name()
-        st.markdown(f"**Round {st.session_state.draft_round}** · **{team_name}** is on the clock")
-
-        positions_remaining = unfilled_positions(team_name)
-        pos_choice = st.selectbox("Choose position", options=positions_remaining, key="draft_pos")
-
-        # candidate pool filtered by position (FULL list, unsorted for variety)
-        cands = [p for p in st.session_state.pool if (p.pos_primary == pos_choice or pos_choice in p.pos_secondary)]
-
-        # create a stable 5-option list for the CURRENT pick (sample from ALL candidates)
-        opt_key = f"opts_r{st.session_state.draft_round}_i{st.session_state.draft_index}_{team_name}_{pos_choice}"
-        if opt_key not in st.session_state:
-            k = min(5, len(cands))
-            st.session_state[opt_key] = random.sample(cands, k) if k > 0 else []
-        shown = st.session_state[opt_key]
-
-        # Optional reshuffle button
-        if st.button("🎲 Reshuffle options"):
-            k = min(5, len(cands))
-            st.session_state[opt_key] = random.sample(cands, k) if k > 0 else []
-            _rerun()
-
-        pick_choice = st.selectbox(
-            "Pick player",
-            options=shown if shown else cands,
-            format_func=player_label,
-            key="draft_player"
-        )
-
-        draft_cols = st.columns([1,1,1])
-        with draft_cols[0]:
-            if st.button("✅ Make Pick"):
-                make_pick(team_name, pos_choice, pick_choice)
-                _rerun()
-        with draft_cols[1]:
-            if st.button("🤖 Auto-Pick (Best)"):
-                if cands:
-                    best_from_shown = sorted(shown, key=overall_score, reverse=True)[0] if shown else cands[0]
-                    make_pick(team_name, pos_choice, best_from_shown)
-                    _rerun()
-        with draft_cols[2]:
-            if st.button("↩️ Undo Last Pick", disabled=len(st.session_state.history)==0):
-                undo_last()
-                _rerun()
+        _draft_picker()
     else:
         st.success("Draft complete! You can simulate the game below.")
 
-    # Draft Board
-    st.divider()
-    st.subheader("📋 Draft Board")
-    a_list = [f"{pos}: {st.session_state.team_a[pos].name if st.session_state.team_a[pos] else '—'}" for pos in POSITIONS]
-    b_list = [f"{pos}: {st.session_state.team_b[pos].name if st.session_state.team_b[pos] else '—'}" for pos in POSITIONS]
-    b1, b2 = st.columns(2)
-    with b1:
-        st.markdown("**Team A**")
-        st.write("\n".join(a_list))
-    with b2:
-        st.markdown("**Team B**")
-        st.write("\n".join(b_list))
-
 with col_right:
-    st.subheader("Lineups")
-    l1, l2 = st.columns(2)
-    with l1:
-        st.markdown("**Team A**")
-        for pos in POSITIONS:
-            p = st.session_state.team_a[pos]
-            st.write(f"{pos}: {p.name if p else '—'}")
-    with l2:
-        st.markdown("**Team B**")
-        for pos in POSITIONS:
-            p = st.session_state.team_b[pos]
-            st.write(f"{pos}: {p.name if p else '—'}")
+    # Draft Board: both lineups in one table
+    st.subheader("📋 Draft Board")
+    t_a, t_b = team_dict("Team A"), team_dict("Team B")
+    board = pd.DataFrame({
+        "Team A": [t_a[pos].name if t_a[pos] else '—' for pos in POSITIONS],
+        "Team B": [t_b[pos].name if t_b[pos] else '—' for pos in POSITIONS],
+    }, index=POSITIONS)
+    st.dataframe(board, use_container_width=True)
 
 
 # ----------------------------- Simulate -----------------------------
-ready = all(st.session_state.team_a.values()) and all(st.session_state.team_b.values())
+ready = st.session_state.filled_a == len(POSITIONS) == st.session_state.filled_b
 
 st.divider()
 simulate = st.button("🚀 Simulate Game", disabled=not ready)
 if simulate and ready:
-    team_a = build_team("Team A", st.session_state.team_a)
-    team_b = build_team("Team B", st.session_state.team_b)
-    result = simulate_game(team_a, team_b, seed=seed_val)
+    picks_a, picks_b = team_dict("Team A"), team_dict("Team B")
+    team_a = Team("Team A", picks_a)
+    team_b = Team("Team B", picks_b)
+    result = E.simulate_game(team_a, team_b, seed=seed_val)
+
+    # Box tables don't touch Streamlit, so build both in the background while
+    # the scoreline and synergy panels render
+    ex = ThreadPoolExecutor(2)
+    fa = ex.submit(team_box_rows, team_a, result["box"][:5])  # rows 0-4 are Team A, 5-9 Team B
+    fb = ex.submit(team_box_rows, team_b, result["box"][5:])
+    ex.shutdown(wait=False)  # submitted work still runs to completion
 
     # Scoreline
     a, b = result["score"]
@@ -270,10 +334,10 @@ if simulate and ready:
     box1, box2 = st.columns(2)
     with box1:
         st.markdown("### Team A Box")
-        st.dataframe(team_box_rows(team_a, result), use_container_width=True)
+        st.dataframe(fa.result(), use_container_width=True)
     with box2:
         st.markdown("### Team B Box")
-        st.dataframe(team_box_rows(team_b, result), use_container_width=True)
+        st.dataframe(fb.result(), use_container_width=True)
 
     st.success("Game complete. Draft new squads or change the seed and run again!")
 elif not ready:
@@ -14,6 +14,11 @@ How to run
 2) Follow prompts to draft each position.
 3) After both teams are set, the game simulates and prints a box score + summary.
 
+Requires numpy. numba is optional: when installed, the single-possession kernel
+behind `possession` and `simulate_many` is JIT-compiled (and `simulate_many`
+runs games in parallel); without it the same code runs as plain Python.
+`simulate_game` is vectorized with NumPy and doesn't use numba either way.
+
 Notes
 -----
 - The pool currently includes ~25 historically accurate stars for demo. You can add the rest of the B/R Top 75 by extending PLAYER_DB.
@@ -23,9 +28,22 @@ Notes
 from __future__ import annotations
 import math
 import random
+import numpy as np
 from dataclasses import dataclass, field
+from enum import IntEnum
 from typing import Dict, List, Tuple
 
+try:  # optional: JIT-compile the possession kernel when numba is available
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda f: f
+    prange = range
+
 # -----------------------------
 # Data Model
 # -----------------------------
@@ -51,6 +69,8 @@ class Player:
 
     # Cached 2K-like attributes (computed later)
     ratings: Dict[str, float] = field(default_factory=dict)
+    # Row of this player in RATINGS (set when PLAYER_DB is indexed)
+    idx: int = -1
 
 # -----------------------------
 # Helper: clamp & scale
@@ -59,15 +79,6 @@ class Player:
 def clamp(x: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, x))
 
-# Normalize value to 0..99
-# Provide a (min_val, max_val) typical NBA range for scaling.
-
-def scale_to_99(val: float, lo: float, hi: float) -> float:
-    if hi == lo:
-        return 50.0
-    t = (val - lo) / (hi - lo)
-    return clamp(99*t, 0, 99)
-
 # -----------------------------
 # Player Database (seed subset)
 # Values are realistic approximations of career numbers.
@@ -184,49 +195,83 @@ PLAYER_DB: List[Player] = [
 # Attribute Builder (2K-like ratings 0..99)
 # -----------------------------
 
-def build_player_ratings(p: Player) -> Dict[str, float]:
+# Columns of RATINGS, and the keys of each Player.ratings dict (lowercased names)
+class Rating(IntEnum):
+    FINISHING = 0
+    THREE = 1
+    MID = 2
+    FT = 3
+    PLAYMAKING = 4
+    PER_DEF = 5
+    INT_DEF = 6
+    REBOUNDING = 7
+    ATHLETIC = 8
+    USAGE = 9
+    THREE_TENDENCY = 10
+
+RATING_KEYS: Tuple[str, ...] = tuple(r.name.lower() for r in Rating)  # matching ratings-dict keys
+
+def scale99_vec(col: np.ndarray, lo: float, hi: float) -> np.ndarray:
+    # normalize a column to 0..99 over a (lo, hi) typical NBA range
+    return np.clip(99*((col - lo) / (hi - lo)), 0, 99)
+
+def build_ratings_matrix(players: List[Player]) -> np.ndarray:
+    """Ratings for every player in one pass: (len(players), len(Rating)), columns
+    per Rating."""
+    ppg, rpg, apg, ts, three_pct, ft_pct, obpm, dbpm, ws48, three_rate, height_in = np.array(
+        [[p.ppg, p.rpg, p.apg, p.ts, p.three_pct, p.ft_pct, p.obpm, p.dbpm, p.ws48, p.three_rate, p.height_in]
+         for p in players], dtype=np.float64).T
+    out = np.empty((len(players), len(Rating)), dtype=np.float64)
+
     # Scoring / Shooting
-    finishing = scale_to_99(p.ts, 0.50, 0.65) * 0.7 + scale_to_99(p.ppg, 12, 32) * 0.3
-    three = scale_to_99(p.three_pct, 0.28, 0.44) * 0.8 + scale_to_99(p.three_rate, 0.02, 0.55) * 0.2
-    mid = (scale_to_99(p.ts, 0.52, 0.60) + scale_to_99(p.ppg, 12, 30)) / 2
-    ft = scale_to_99(p.ft_pct, 0.60, 0.92)
+    out[:, Rating.FINISHING] = scale99_vec(ts, 0.50, 0.65) * 0.7 + scale99_vec(ppg, 12, 32) * 0.3
+    out[:, Rating.THREE] = scale99_vec(three_pct, 0.28, 0.44) * 0.8 + scale99_vec(three_rate, 0.02, 0.55) * 0.2
+    out[:, Rating.MID] = (scale99_vec(ts, 0.52, 0.60) + scale99_vec(ppg, 12, 30)) / 2
+    out[:, Rating.FT] = scale99_vec(ft_pct, 0.60, 0.92)
 
     # Playmaking
-    playmaking = scale_to_99(p.apg, 2.0, 11.5) * 0.7 + scale_to_99(p.obpm, 0.0, 10.5) * 0.3
+    out[:, Rating.PLAYMAKING] = scale99_vec(apg, 2.0, 11.5) * 0.7 + scale99_vec(obpm, 0.0, 10.5) * 0.3
 
     # Defense
-    per_def = scale_to_99(p.dbpm, 0.0, 4.8) * 0.7 + scale_to_99(p.ws48, 0.10, 0.26) * 0.3
-    int_def = scale_to_99(p.dbpm, 0.0, 4.8) * 0.6 + scale_to_99(p.rpg, 3.5, 13.0) * 0.4
+    out[:, Rating.PER_DEF] = scale99_vec(dbpm, 0.0, 4.8) * 0.7 + scale99_vec(ws48, 0.10, 0.26) * 0.3
+    out[:, Rating.INT_DEF] = scale99_vec(dbpm, 0.0, 4.8) * 0.6 + scale99_vec(rpg, 3.5, 13.0) * 0.4
 
     # Rebounding
-    reb = scale_to_99(p.rpg, 3.5, 13.0) * 0.7 + scale_to_99(p.height_in, 72, 86) * 0.3
+    out[:, Rating.REBOUNDING] = scale99_vec(rpg, 3.5, 13.0) * 0.7 + scale99_vec(height_in, 72, 86) * 0.3
 
     # Athleticism (rough proxy)
-    athletic = (scale_to_99(p.ws48, 0.10, 0.26) * 0.5 + scale_to_99(p.ts, 0.50, 0.65) * 0.5)
+    out[:, Rating.ATHLETIC] = scale99_vec(ws48, 0.10, 0.26) * 0.5 + scale99_vec(ts, 0.50, 0.65) * 0.5
 
     # Usage tendency (for shot selection)
-    usage = clamp(0.25 + (p.ppg - 15) * 0.015, 0.10, 0.40)  # 10%-40%
+    out[:, Rating.USAGE] = np.clip(0.25 + (ppg - 15) * 0.015, 0.10, 0.40)  # 10%-40%
 
     # 3P attempt tendency
-    three_tendency = clamp(p.three_rate, 0.00, 0.60)
-
-    return {
-        "finishing": finishing,
-        "three": three,
-        "mid": mid,
-        "ft": ft,
-        "playmaking": playmaking,
-        "per_def": per_def,
-        "int_def": int_def,
-        "rebounding": reb,
-        "athletic": athletic,
-        "usage": usage,
-        "three_tendency": three_tendency,
-    }
+    out[:, Rating.THREE_TENDENCY] = np.clip(three_rate, 0.00, 0.60)
+    return out
 
-# Precompute ratings
-for p in PLAYER_DB:
-    p.ratings = build_player_ratings(p)
+def build_player_ratings(p: Player) -> Dict[str, float]:
+    return dict(zip(RATING_KEYS, build_ratings_matrix([p])[0].tolist()))
+
+# Precompute ratings for the whole pool at once. RATINGS is the same data as one
+# (n_players, len(Rating)) matrix, so lineups can be read as row slices instead
+# of per-player dict lookups; the per-player dicts stay for existing callers.
+RATINGS = build_ratings_matrix(PLAYER_DB)
+for i, (p, row) in enumerate(zip(PLAYER_DB, RATINGS.tolist())):
+    p.idx = i
+    p.ratings = dict(zip(RATING_KEYS, row))
+
+# Auto-draft value of every player (offense + defense + half of rebounding);
+# auto-picks take the argmax over the eligible, still-available players
+AUTO_SCORE = (RATINGS[:, [Rating.FINISHING, Rating.THREE, Rating.MID, Rating.PLAYMAKING,
+                          Rating.PER_DEF, Rating.INT_DEF]].sum(axis=1)
+              + 0.5*RATINGS[:, Rating.REBOUNDING])
+
+def _auto_score(p: Player) -> float:
+    # AUTO_SCORE for one player, including players added outside PLAYER_DB
+    if p.idx >= 0:
+        return float(AUTO_SCORE[p.idx])
+    r = p.ratings or dict(zip(RATING_KEYS, build_ratings_matrix([p])[0]))
+    return r['finishing']+r['three']+r['mid']+r['playmaking'] + r['per_def']+r['int_def'] + 0.5*r['rebounding']
 
 # -----------------------------
 # Team / Draft
@@ -234,195 +279,425 @@ for p in PLAYER_DB:
 
 POSITIONS = ["PG","SG","SF","PF","C"]
 
+# position -> PLAYER_DB indices of everyone eligible there (primary or secondary),
+# in PLAYER_DB order; drafts filter these against a set of available indices
+POS_INDEX: Dict[str, List[int]] = {
+    pos: [i for i, p in enumerate(PLAYER_DB) if p.pos_primary == pos or pos in p.pos_secondary]
+    for pos in POSITIONS
+}
+
+def _cdf(weights: np.ndarray) -> np.ndarray:
+    c = np.cumsum(weights)
+    return c / c[-1]  # last entry is exactly 1.0, so any u in [0, 1) lands in range
+
+@dataclass(frozen=True)
+class SynConsts:
+    """A team's synergy terms as they enter the possession model, already shifted
+    and scaled, so the probabilities only add them up. Built once per Team by
+    Team.syn_consts()."""
+    # used when the team is on offense
+    tov_off_adj: float
+    assist_move_adj: float
+    assist_space_adj: float
+    p3_space_adj: float
+    inside_off_adj: float
+    reb_off_adj: float
+    # used when the team is on defense
+    tov_def_adj: float
+    p3_def_adj: float
+    make3_def_adj: float
+    make2_def_adj: float
+    inside_def_adj: float
+    foul_def_adj: float
+    ft_def_adj: float
+    putback_def_adj: float
+    reb_def_adj: float
+
+    @classmethod
+    def from_synergy(cls, syn: Dict[str, float]) -> SynConsts:
+        return cls(
+            tov_off_adj=-(syn["ball_move"]-50)*0.001,
+            assist_move_adj=(syn["ball_move"]-50)*0.012,
+            assist_space_adj=(syn["spacing"]-50)*0.006,
+            p3_space_adj=(syn["spacing"]-50)*0.002,
+            inside_off_adj=syn["rim_pressure"]*0.01,
+            reb_off_adj=syn["rebounding"]*0.003,
+            tov_def_adj=(syn["per_def"]-50)*0.001,
+            p3_def_adj=-(syn["per_def"]-50)*0.0015,
+            make3_def_adj=-syn["per_def"]*0.0035,
+            make2_def_adj=-(0.7*syn["int_def"] + 0.3*syn["per_def"])*0.0035,
+            inside_def_adj=-syn["int_def"]*0.01,
+            foul_def_adj=-(syn["int_def"]-50)*0.001,
+            ft_def_adj=-(syn["int_def"]-50)*0.001,
+            putback_def_adj=-(syn["int_def"]-50)*0.003,
+            reb_def_adj=-syn["rebounding"]*0.003,
+        )
+
 @dataclass
 class Team:
     name: str
     lineup: Dict[str, Player]  # pos -> Player
+    # Lineups don't change once drafted, so everything derived from them
+    # (player order, synergy, pick weights) is computed once per Team
+    _players_cache: List[Player] | None = field(default=None, init=False, repr=False, compare=False)
+    _lineup_arr: np.ndarray | None = field(default=None, init=False, repr=False, compare=False)
+    _ratings_cache: np.ndarray | None = field(default=None, init=False, repr=False, compare=False)
+    _synergy_cache: Dict[str, float] | None = field(default=None, init=False, repr=False, compare=False)
+    _consts_cache: SynConsts | None = field(default=None, init=False, repr=False, compare=False)
+    _cdf_cache: Tuple[np.ndarray, ...] | None = field(default=None, init=False, repr=False, compare=False)
+    _probs_cache: Tuple[Team, np.ndarray] | None = field(default=None, init=False, repr=False, compare=False)
 
     def all_players(self) -> List[Player]:
-        return [self.lineup[pos] for pos in POSITIONS]
+        """Lineup in POSITIONS order. The list is shared; don't mutate it."""
+        if self._players_cache is None:
+            self._players_cache = [self.lineup[pos] for pos in POSITIONS]
+        return self._players_cache
+
+    def all_players_idx(self) -> np.ndarray:
+        """RATINGS rows of all_players(), as a shared (5,) int32 array. Players
+        that aren't in PLAYER_DB have -1; use lineup_ratings() for their ratings."""
+        if self._lineup_arr is None:
+            self._lineup_arr = np.array([p.idx for p in self.all_players()], dtype=np.int32)
+        return self._lineup_arr
+
+    def lineup_ratings(self) -> np.ndarray:
+        """(5, len(Rating)) ratings of all_players(), columns per Rating. Rows come
+        from RATINGS, except for players added outside PLAYER_DB, whose row is
+        read from their ratings dict (or built from their stats if it's empty)."""
+        if self._ratings_cache is None:
+            rows = RATINGS[self.all_players_idx()]  # a copy, so patching rows is safe
+            for j, p in enumerate(self.all_players()):
+                if p.idx < 0:
+                    rows[j] = [p.ratings[k] for k in RATING_KEYS] if p.ratings else build_ratings_matrix([p])[0]
+            self._ratings_cache = rows
+        return self._ratings_cache
 
     def team_synergy(self) -> Dict[str, float]:
-        players = self.all_players()
+        if self._synergy_cache is None:
+            self._synergy_cache = self._compute_synergy()
+        return self._synergy_cache
+
+    def pick_cdfs(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Normalized cumulative pick weights, in lineup order: (shooter by usage,
+        passer by playmaking, rebounder by rebounding). Sample a slot with
+        np.searchsorted(cdf, u, side="right") for a uniform u.
+
+        The passer entry is (5, 5): row s excludes shooter s by giving it zero
+        weight, so its CDF step is flat and searchsorted never lands on it."""
+        if self._cdf_cache is None:
+            r = self.lineup_ratings()
+            pm = np.maximum(r[:, Rating.PLAYMAKING], 1.0)
+            self._cdf_cache = (
+                _cdf(np.maximum(r[:, Rating.USAGE], 0.05)),
+                np.stack([_cdf(np.where(np.arange(5) == s, 0.0, pm)) for s in range(5)]),
+                _cdf(np.maximum(r[:, Rating.REBOUNDING], 1.0)),
+            )
+        return self._cdf_cache
+
+    def syn_consts(self) -> SynConsts:
+        if self._consts_cache is None:
+            self._consts_cache = SynConsts.from_synergy(self.team_synergy())
+        return self._consts_cache
+
+    def probs_against(self, defn: Team) -> np.ndarray:
+        """possession_probs(self, defn), cached for the most recent opponent."""
+        if self._probs_cache is None or self._probs_cache[0] is not defn:
+            self._probs_cache = (defn, possession_probs(self, defn))
+        return self._probs_cache[1]
+
+    def _compute_synergy(self) -> Dict[str, float]:
+        r = self.lineup_ratings()
+        big = np.array([p.pos_primary in ("PF", "C") for p in self.all_players()])  # bigs get full int-D credit
         # Aggregates
-        spacing = sum(p.ratings["three"] * (0.5 + p.ratings["three_tendency"]) for p in players) / len(players)
-        rim_pressure = sum(p.ratings["finishing"] for p in players) / len(players)
-        ball_move = sum(p.ratings["playmaking"] for p in players) / len(players)
-        int_def = sum((p.ratings["int_def"] if p.pos_primary in ["PF","C"] else p.ratings["int_def"]*0.8) for p in players) / len(players)
-        per_def = sum((p.ratings["per_def"] if p.pos_primary in ["PG","SG","SF"] else p.ratings["per_def"]*0.8) for p in players) / len(players)
-        reb = sum(p.ratings["rebounding"] for p in players) / len(players)
+        spacing = (r[:, Rating.THREE] * (0.5 + r[:, Rating.THREE_TENDENCY])).mean()
+        rim_pressure = r[:, Rating.FINISHING].mean()
+        ball_move = r[:, Rating.PLAYMAKING].mean()
+        int_def = (r[:, Rating.INT_DEF] * np.where(big, 1.0, 0.8)).mean()
+        per_def = (r[:, Rating.PER_DEF] * np.where(big, 0.8, 1.0)).mean()
+        reb = r[:, Rating.REBOUNDING].mean()
         pace = 96 + (ball_move - 50) * 0.1 + (spacing - 50) * 0.05
         return {
-            "spacing": spacing,
-            "rim_pressure": rim_pressure,
-            "ball_move": ball_move,
-            "int_def": int_def,
-            "per_def": per_def,
-            "rebounding": reb,
-            "pace": clamp(pace, 90, 104),
+            "spacing": float(spacing),
+            "rim_pressure": float(rim_pressure),
+            "ball_move": float(ball_move),
+            "int_def": float(int_def),
+            "per_def": float(per_def),
+            "rebounding": float(reb),
+            "pace": clamp(float(pace), 90, 104),
         }
 
 # -----------------------------
 # Simulation Engine
 # -----------------------------
 
-def possession(off: Team, defn: Team) -> Tuple[int, Dict[str,int]]:
-    """Simulate a single possession. Returns (points_scored, stat_updates)
-    stat_updates: {player_name_stat: value} e.g., {"LeBron James_pts": 2, "LeBron James_ast": 1}
-    """
-    stats: Dict[str,int] = {}
-
-    off_syn = off.team_synergy()
-    def_syn = defn.team_synergy()
+# Columns of the possession_probs table. Every probability in the model is
+# computed there, once per matchup; both the scalar kernel and the batch path
+# only compare draws against it. Turnover and offensive-board chances don't
+# depend on the shooter, so their columns hold the same value in every row.
+(P_TOV, P_ASSIST, P_THREE, P_MAKE3, P_MAKE2, P_FOUL, P_FT, P_PUTBACK, P_OREB) = range(9)
+N_PROBS = 9
+
+def possession_probs(off: Team, defn: Team) -> np.ndarray:
+    """Probabilities of each decision when `off` attacks `defn`, as a
+    (5, N_PROBS) table: rows are the offense's players in lineup order (as the
+    shooter), columns per P_*."""
+    r = off.lineup_ratings()
+    off_c, def_c = off.syn_consts(), defn.syn_consts()
+    finishing, mid, three, ft = r[:, Rating.FINISHING], r[:, Rating.MID], r[:, Rating.THREE], r[:, Rating.FT]
+    out = np.empty((5, N_PROBS))
 
     # Base turnover probability influenced by ball movement and perimeter defense
-    base_tov = 0.125
-    tov = clamp(base_tov - (off_syn["ball_move"]-50)*0.001 + (def_syn["per_def"]-50)*0.001, 0.06, 0.18)
-
-    if random.random() < tov:
-        return 0, stats  # turnover
-
-    # Choose shooter weighted by usage
-    players = off.all_players()
-    weights = [max(0.05, p.ratings["usage"]) for p in players]
-    shooter = random.choices(players, weights=weights, k=1)[0]
-
-     # Chance the possession is assisted based on team ball-movement and the shooter’s playmaking
-    # — boosted so high-IQ creators rack up more assists
-    assist_raw = (
-        0.45  # big base to drive up assist counts
-        + (off_syn["ball_move"] - 50) * 0.012
-        + (off_syn["spacing"]   - 50) * 0.006
-        + (shooter.ratings["playmaking"] - 50) * 0.015
-    )
-    assist_prob = clamp(assist_raw, 0.45, 0.97)
-    assisted = random.random() < assist_prob
+    out[:, P_TOV] = np.clip(0.125 + off_c.tov_off_adj + def_c.tov_def_adj, 0.06, 0.18)
 
+    # Assist chance from team ball movement/spacing and the shooter's playmaking
+    out[:, P_ASSIST] = np.clip(0.45 + off_c.assist_move_adj + off_c.assist_space_adj
+                               + (r[:, Rating.PLAYMAKING] - 50) * 0.015, 0.45, 0.97)
 
     # Shot type decision (3 vs 2)
-    p3 = clamp(0.05 + shooter.ratings["three_tendency"] + (off_syn["spacing"]-50)*0.002 - (def_syn["per_def"]-50)*0.0015, 0.03, 0.65)
-    is_three = random.random() < p3
+    out[:, P_THREE] = np.clip(0.05 + r[:, Rating.THREE_TENDENCY] + off_c.p3_space_adj + def_c.p3_def_adj, 0.03, 0.65)
+
+    # Make chances; 2s blend finishing and mid-range by how much the offense gets to the rim
+    out[:, P_MAKE3] = np.clip(three * 0.0035 + def_c.make3_def_adj + 0.48 - 0.07, 0.24, 0.52)
+    inside_bias = np.clip(off_c.inside_off_adj + def_c.inside_def_adj + 0.5, 0.3, 0.7)
+    out[:, P_MAKE2] = np.clip((inside_bias*finishing + (1-inside_bias)*mid) * 0.0035 + def_c.make2_def_adj + 0.48,
+                              0.30, 0.73)
+
+    # Fouls (on missed 2PT drives only), then each of the 2 free throws
+    out[:, P_FOUL] = np.clip(0.05 + (finishing-50)*0.002 + def_c.foul_def_adj, 0.03, 0.18)
+    out[:, P_FT] = np.clip(0.44 + (ft-50)*0.006 + def_c.ft_def_adj, 0.50, 0.95)
+
+    # Rebound chance, and the shooter's quick putback after an offensive board
+    out[:, P_OREB] = np.clip(off_c.reb_off_adj + def_c.reb_def_adj + 0.24, 0.16, 0.34)
+    out[:, P_PUTBACK] = np.clip(0.54 + (finishing-50)*0.004 + def_c.putback_def_adj, 0.40, 0.80)
+    return out
+
+# Layout of the int array returned by _possession_kernel; -1 marks "nobody"
+# (the shooter is -1 on a turnover). All points go to the shooter.
+K_POINTS, K_SHOOTER, K_FGA, K_FGM, K_FTA, K_FTM, K_PASSER, K_OREB, K_DREB = range(9)
+
+# Uniform draws consumed per possession, one slot per decision. The batch draws
+# an (n, N_UNIFORMS) block, i.e. possession by possession in this order, so n
+# calls to `possession` from the same Generator state play out the same n
+# possessions as one `_possession_batch` of size n.
+(U_TOV, U_SHOOTER, U_ASSIST, U_THREE, U_MAKE, U_FOUL,
+ U_FT1, U_FT2, U_OREB, U_BOARDER, U_PUTBACK, U_PASSER) = range(12)
+N_UNIFORMS = 12
+
+# Stream for callers of `possession` that don't pass their own Generator
+_RNG = np.random.default_rng()
+
+@njit(cache=True)
+def _possession_kernel(probs, off_usage_cdf, off_mate_cdf, off_reb_cdf, def_reb_cdf, u):
+    """Numeric core of `possession`: the matchup's possession_probs table, pick
+    weights as Team.pick_cdfs() CDFs, and `u` the N_UNIFORMS draws in U_* order.
+    Resolves the same decisions as `_possession_batch`, one possession at a time.
+    Returns the K_* layout as an int32 array."""
+    out = np.zeros(9, dtype=np.int32)
+    out[K_SHOOTER] = -1
+    out[K_PASSER] = -1
+    out[K_OREB] = -1
+    out[K_DREB] = -1
+
+    if u[U_TOV] < probs[0, P_TOV]:
+        return out  # turnover
 
-    # Make probability from ratings and defense impact
-    if is_three:
-        shot_skill = shooter.ratings["three"]
-        def_impact = def_syn["per_def"]
-    else:
-        # Blend finishing & mid based on rim pressure / interior defense
-        inside_bias = clamp((off_syn["rim_pressure"] - def_syn["int_def"]) * 0.01 + 0.5, 0.3, 0.7)
-        shot_skill = inside_bias * shooter.ratings["finishing"] + (1-inside_bias) * shooter.ratings["mid"]
-        def_impact = 0.7*def_syn["int_def"] + 0.3*def_syn["per_def"]
-
-    # Convert skill/defense to make prob
-    base = (shot_skill - def_impact) * 0.0035 + 0.48  # tuned around realistic FG%
-    if is_three:
-        base -= 0.07  # harder shot baseline
-    make_prob = clamp(base, 0.30 if not is_three else 0.24, 0.73 if not is_three else 0.52)
-
-    # Fouls (on 2PT drives more likely)
-    foul_prob = clamp(0.05 + (shooter.ratings["finishing"]-50)*0.002 - (def_syn["int_def"]-50)*0.001, 0.03, 0.18)
-    drew_foul = (not is_three) and (random.random() < foul_prob)
-
-    points = 0
-    made = random.random() < make_prob
-
-    if made:
-        points = 3 if is_three else 2
-        key = f"{shooter.name}_pts"; stats[key] = stats.get(key, 0) + points
-        key = f"{shooter.name}_fga"; stats[key] = stats.get(key, 0) + 1
-        key = f"{shooter.name}_fgm"; stats[key] = stats.get(key, 0) + 1
+    # Choose shooter weighted by usage
+    s = np.searchsorted(off_usage_cdf, u[U_SHOOTER], side="right")
+    out[K_SHOOTER] = s
+    p = probs[s]
+
+    assisted = u[U_ASSIST] < p[P_ASSIST]
+    is_three = u[U_THREE] < p[P_THREE]
+    make_prob = p[P_MAKE3] if is_three else p[P_MAKE2]
+    drew_foul = (not is_three) and (u[U_FOUL] < p[P_FOUL])
+
+    out[K_FGA] = 1
+    if u[U_MAKE] < make_prob:
+        out[K_POINTS] = 3 if is_three else 2
+        out[K_FGM] = 1
         if assisted:
-            # pick a random teammate weighted by playmaking
-            mates  = [p for p in players if p is not shooter]
-            weights = [max(1.0, tm.ratings["playmaking"]) for tm in mates]
-            passer = random.choices(mates, weights=weights, k=1)[0]
-            stats[f"{passer.name}_ast"] = stats.get(f"{passer.name}_ast", 0) + 1
-
-        return points, stats
-
-    # Missed shot path
-    key = f"{shooter.name}_fga"; stats[key] = stats.get(key, 0) + 1
+            # a teammate, weighted by playmaking (row s has the shooter's weight zeroed)
+            out[K_PASSER] = np.searchsorted(off_mate_cdf[s], u[U_PASSER], side="right")
+        return out
 
     if drew_foul:
         # 2 free throws
-        ft_makes = 0
-        for _ in range(2):
-            ft_prob = clamp(0.44 + (shooter.ratings["ft"]-50)*0.006 - (def_syn["int_def"]-50)*0.001, 0.50, 0.95)
-            if random.random() < ft_prob:
-                ft_makes += 1
+        ft_makes = int(u[U_FT1] < p[P_FT]) + int(u[U_FT2] < p[P_FT])
         if ft_makes:
-            key = f"{shooter.name}_pts"; stats[key] = stats.get(key, 0) + ft_makes
-            key = f"{shooter.name}_fta"; stats[key] = stats.get(key, 0) + 2
-            key = f"{shooter.name}_ftm"; stats[key] = stats.get(key, 0) + ft_makes
-            return ft_makes, stats
-
-    # Rebound chance
-    off_reb_edge = (off_syn["rebounding"] - def_syn["rebounding"]) * 0.003 + 0.24
-    oreb = random.random() < clamp(off_reb_edge, 0.16, 0.34)
-    if oreb:
-        # Offensive rebound: pick among all five by rebounding rating
-        weights = [max(1.0, p.ratings["rebounding"]) for p in players]
-        boarder = random.choices(players, weights=weights, k=1)[0]
-        stats[f"{boarder.name}_orb"] = stats.get(f"{boarder.name}_orb", 0) + 1
-
-        # Quick putback attempt
-        putback_prob = clamp(0.54 + (shooter.ratings["finishing"]-50)*0.004
-                             - (def_syn["int_def"]-50)*0.003, 0.40, 0.80)
-        if random.random() < putback_prob:
-            stats[f"{shooter.name}_pts"] = stats.get(f"{shooter.name}_pts", 0) + 2
-            stats[f"{shooter.name}_fga"] = stats.get(f"{shooter.name}_fga", 0) + 1
-            stats[f"{shooter.name}_fgm"] = stats.get(f"{shooter.name}_fgm", 0) + 1
-            return 2, stats
-        else:
-            stats[f"{shooter.name}_fga"] = stats.get(f"{shooter.name}_fga", 0) + 1
-            return 0, stats
+            out[K_POINTS] = ft_makes
+            out[K_FTA] = 2
+            out[K_FTM] = ft_makes
+            return out
+
+    if u[U_OREB] < p[P_OREB]:
+        out[K_OREB] = np.searchsorted(off_reb_cdf, u[U_BOARDER], side="right")
+        # Quick putback attempt by the shooter
+        out[K_FGA] = 2
+        if u[U_PUTBACK] < p[P_PUTBACK]:
+            out[K_POINTS] = 2
+            out[K_FGM] = 1
     else:
-        # Defensive rebound: pick among all five defenders by rebounding rating
-        defenders = defn.all_players()
-        weights_def = [max(1.0, p.ratings["rebounding"]) for p in defenders]
-        dboarder = random.choices(defenders, weights=weights_def, k=1)[0]
-        stats[f"{dboarder.name}_drb"] = stats.get(f"{dboarder.name}_drb", 0) + 1
-        return 0, stats
-
-
+        out[K_DREB] = np.searchsorted(def_reb_cdf, u[U_BOARDER], side="right")
+    return out
+
+# Columns of the box-score counter; rows are players in lineup order
+STAT_KEYS = ("pts", "fga", "fgm", "fta", "ftm", "ast", "orb", "drb")
+STAT_IDX = {k: i for i, k in enumerate(STAT_KEYS)}
+
+# Kernel slots credited to the shooter, lined up with STAT_KEYS[:5]
+_SHOOTER_K = np.array([K_POINTS, K_FGA, K_FGM, K_FTA, K_FTM])
+
+def possession(off: Team, defn: Team, rng: np.random.Generator | None = None) -> Tuple[int, np.ndarray, bool, int]:
+    """Simulate a single possession. Returns (points_scored, delta, is_defensive_board, board_local_idx)
+    delta: (5, len(STAT_KEYS)) int16 stat updates for the offense in lineup order,
+    columns per STAT_IDX, e.g. delta[shooter, STAT_IDX["pts"]] == 2. A defensive
+    rebound is the only stat the defense can get, so it comes back as the flag
+    plus board_local_idx (the defender's lineup slot). board_local_idx is the
+    offensive rebounder when the flag is False, or -1 if there was no rebound.
+    Draws from `rng` (a module-level stream if omitted).
+    """
+    off_cdfs, def_cdfs = off.pick_cdfs(), defn.pick_cdfs()
+    out = _possession_kernel(off.probs_against(defn), off_cdfs[0], off_cdfs[1], off_cdfs[2], def_cdfs[2],
+                             (rng or _RNG).random(N_UNIFORMS))
+    delta = np.zeros((5, len(STAT_KEYS)), dtype=np.int16)
+    s = out[K_SHOOTER]
+    if s < 0:
+        return 0, delta, False, -1  # turnover
+
+    delta[s, :5] = out[_SHOOTER_K]
+    if out[K_PASSER] >= 0:
+        delta[out[K_PASSER], STAT_IDX["ast"]] += 1
+    if out[K_OREB] >= 0:
+        delta[out[K_OREB], STAT_IDX["orb"]] += 1
+        return int(out[K_POINTS]), delta, False, int(out[K_OREB])
+    return int(out[K_POINTS]), delta, bool(out[K_DREB] >= 0), int(out[K_DREB])
+
+def _possession_batch(off: Team, defn: Team, n: int, rng: np.random.Generator) -> Tuple[int, np.ndarray, np.ndarray]:
+    """Simulate `n` possessions of `off` against `defn` at once.
+
+    Same model as `possession`, but every decision is drawn up front as an array
+    and resolved elementwise. Possessions don't depend on each other, so this is
+    equivalent to running `possession` n times.
+    Returns (points, off_box, def_box); the boxes are (5, len(STAT_KEYS)) int
+    arrays in lineup order (the defense only ever collects defensive boards).
+    """
+    # Only 5 possible shooters, so the probabilities are tabulated per shooter
+    # and gathered by shooter below
+    P = off.probs_against(defn)
+    usage_cdf, mate_cdf, oreb_cdf = off.pick_cdfs()
+    dreb_cdf = defn.pick_cdfs()[2]
+
+    def pick(cdf: np.ndarray, u: np.ndarray) -> np.ndarray:
+        return np.searchsorted(cdf, u, side="right")
+
+    # one row per possession in U_* order (the scalar path's draw order), then
+    # transposed to one array per decision
+    (rand_tov, rand_shooter, rand_assist, rand_3, rand_make, rand_foul,
+     rand_ft1, rand_ft2, rand_oreb, rand_boarder, rand_putback, rand_passer) = rng.random((n, N_UNIFORMS)).T
+
+    live = rand_tov >= P[0, P_TOV]
+    shooter = pick(usage_cdf, rand_shooter)
+    is_three = rand_3 < P[shooter, P_THREE]
+    made = live & (rand_make < np.where(is_three, P[shooter, P_MAKE3], P[shooter, P_MAKE2]))
+    missed = live & ~made
+    drew_foul = missed & ~is_three & (rand_foul < P[shooter, P_FOUL])
+    ft_prob = P[shooter, P_FT]
+    ft_makes = (rand_ft1 < ft_prob).astype(int) + (rand_ft2 < ft_prob)
+    ft_scored = drew_foul & (ft_makes > 0)
+    rebound = missed & ~ft_scored
+    oreb = rebound & (rand_oreb < P[0, P_OREB])
+    dreb = rebound & ~oreb
+    putback = oreb & (rand_putback < P[shooter, P_PUTBACK])
+    assisted = made & (rand_assist < P[shooter, P_ASSIST])
+
+    points = np.where(made, np.where(is_three, 3, 2), 0) + np.where(ft_scored, ft_makes, 0) + 2*putback
+
+    # Passer is weighted by playmaking among the shooter's teammates: searchsorted
+    # on each possession's row of the mate CDFs (count of entries <= u)
+    passer = (mate_cdf[shooter] <= rand_passer[:, None]).sum(axis=1)
+
+    off_box = np.zeros((5, len(STAT_KEYS)), dtype=np.int32)
+    def_box = np.zeros((5, len(STAT_KEYS)), dtype=np.int32)
+    np.add.at(off_box[:, STAT_IDX["pts"]], shooter, points)
+    np.add.at(off_box[:, STAT_IDX["fga"]], shooter, live.astype(int) + oreb)  # putback attempts count too
+    np.add.at(off_box[:, STAT_IDX["fgm"]], shooter, made.astype(int) + putback)
+    np.add.at(off_box[:, STAT_IDX["fta"]], shooter, 2*ft_scored)
+    np.add.at(off_box[:, STAT_IDX["ftm"]], shooter, np.where(ft_scored, ft_makes, 0))
+    np.add.at(off_box[:, STAT_IDX["ast"]], passer[assisted], 1)
+    np.add.at(off_box[:, STAT_IDX["orb"]], pick(oreb_cdf, rand_boarder)[oreb], 1)
+    np.add.at(def_box[:, STAT_IDX["drb"]], pick(dreb_cdf, rand_boarder)[dreb], 1)
+    return int(points.sum()), off_box, def_box
 
 def simulate_game(team_a: Team, team_b: Team, seed: int|None = None) -> Dict:
-    if seed is not None:
-        random.seed(seed)
+    # SeedSequence rejects negative ints, which the CLI/app seed prompts accept
+    rng = np.random.default_rng(None if seed is None else seed % 2**64)
 
     a_syn = team_a.team_synergy(); b_syn = team_b.team_synergy()
     pace = (a_syn["pace"] + b_syn["pace"]) / 2.0
     possessions = int(pace)
 
-    score_a = 0
-    score_b = 0
-    box: Dict[str, Dict[str,int]] = {}
-
-    def merge_stats(updates: Dict[str,int]):
-        for k, v in updates.items():
-            player_key, stat = k.rsplit('_', 1)
-            if player_key not in box:
-                box[player_key] = {"pts":0,"fga":0,"fgm":0,"fta":0,"ftm":0,"ast":0,"orb":0,"drb":0}
-            box[player_key][stat] = box[player_key].get(stat, 0) + v
-
-    # Alternate possessions
-    for i in range(possessions*2):
-        if i % 2 == 0:
-            pts, updates = possession(team_a, team_b)
-            score_a += pts
-            merge_stats(updates)
-        else:
-            pts, updates = possession(team_b, team_a)
-            score_b += pts
-            merge_stats(updates)
+    # Each side gets `possessions` trips; they're independent, so run them as two batches
+    score_a, a_off, b_def = _possession_batch(team_a, team_b, possessions, rng)
+    score_b, b_off, a_def = _possession_batch(team_b, team_a, possessions, rng)
+
+    # Rows 0-4 are team A and 5-9 team B, each in lineup order; columns per STAT_IDX
+    box_arr = np.zeros((10, len(STAT_KEYS)), dtype=np.int32)
+    box_arr[:5] = a_off + a_def
+    box_arr[5:] = b_off + b_def
 
     return {
         "score": (score_a, score_b),
-        "box": box,
+        "box": box_arr,
         "syn": {team_a.name: a_syn, team_b.name: b_syn},
         "possessions": possessions*2,
     }
 
+# Monte Carlo over many games (e.g. to compare drafts): same model as the scalar
+# `possession` path, with the whole game loop compiled and games spread across
+# threads. Each side goes in as a tuple of kernel arrays, see _kernel_inputs.
+
+def _kernel_inputs(off: Team, defn: Team) -> Tuple[np.ndarray, ...]:
+    # (probs against defn, usage cdf, mate cdfs, rebound cdf)
+    return (off.probs_against(defn),) + off.pick_cdfs()
+
+@njit(cache=True)
+def _simulate_one(a, b, u):
+    # u: (2*possessions, N_UNIFORMS) draws, alternating A's and B's possessions
+    score_a = 0
+    score_b = 0
+    for i in range(u.shape[0] // 2):
+        score_a += _possession_kernel(a[0], a[1], a[2], a[3], b[3], u[2*i])[K_POINTS]
+        score_b += _possession_kernel(b[0], b[1], b[2], b[3], a[3], u[2*i + 1])[K_POINTS]
+    return score_a, score_b
+
+@njit(parallel=True, cache=True)
+def _simulate_many(a, b, possessions, seeds):
+    n = len(seeds)
+    results = np.empty((n, 2), np.int32)
+    for g in prange(n):  # each game writes its own row
+        # compiled, this seeds the running thread's own MT19937 state, so games
+        # don't share a stream (and NumPy's global state is never touched)
+        np.random.seed(seeds[g])
+        results[g, 0], results[g, 1] = _simulate_one(a, b, np.random.random((2*possessions, N_UNIFORMS)))
+    return results
+
+def simulate_many(team_a: Team, team_b: Team, n: int, seed: int|None = None) -> np.ndarray:
+    """Play `n` independent games and return their scores as an (n, 2) int32
+    array of (team_a, team_b). Box scores are not kept. A given seed always
+    yields the same results, though not the same games as simulate_game."""
+    seeds = np.random.default_rng(None if seed is None else seed % 2**64).integers(2**32, size=n)
+    pace = (team_a.team_synergy()["pace"] + team_b.team_synergy()["pace"]) / 2.0
+    a, b, possessions = _kernel_inputs(team_a, team_b), _kernel_inputs(team_b, team_a), int(pace)
+    if HAVE_NUMBA:
+        return _simulate_many(a, b, possessions, seeds)
+    # Plain Python: the same MT19937 draws per seed, from a RandomState per game
+    # (np.random.seed here would reset the global state for every importer)
+    results = np.empty((n, 2), np.int32)
+    for g, game_seed in enumerate(seeds):
+        u = np.random.RandomState(game_seed).random_sample((2*possessions, N_UNIFORMS))
+        results[g] = _simulate_one(a, b, u)
+    return results
+
 # -----------------------------
 # CLI Draft Helpers
 # -----------------------------
@@ -441,12 +716,16 @@ def draft_team(team_name: str, available: List[Player]) -> Team:
     # Print header with leading/trailing newlines properly
     print(f"\nDrafting for {team_name}...\n")
 
-
+    # PLAYER_DB players go through POS_INDEX; anyone added outside it (idx -1)
+    # is still filtered the slow way
+    avail_set = {p.idx for p in available if p.idx >= 0}
+    extra = [p for p in available if p.idx < 0]
     for pos in POSITIONS:
-        candidates = list_by_position(pos, available)
+        candidates = [PLAYER_DB[i] for i in POS_INDEX[pos] if i in avail_set] + list_by_position(pos, extra)
         if not candidates:
             raise ValueError(f"No candidates left for {pos}")
-        # randomly limit to at most 5 options for the user
+        # randomly limit to at most 5 options for the user (cold path; the only
+        # use of the stdlib random module left)
         options = random.sample(candidates, min(5, len(candidates)))
         print(f"Available {pos}s (showing {len(options)} of {len(candidates)}):")
         for p in options:
@@ -459,6 +738,10 @@ def draft_team(team_name: str, available: List[Player]) -> Team:
                 continue
             lineup[pos] = sel
             available.remove(sel)
+            if sel.idx >= 0:
+                avail_set.discard(sel.idx)
+            else:
+                extra.remove(sel)
             print(f"Selected {sel.name} at {pos}.\n")
 
             break
@@ -478,16 +761,16 @@ def print_box(result: Dict, team_a: Team, team_b: Team):
     for tname, syn in result["syn"].items():
         print(f"- {tname}: spacing {syn['spacing']:.1f}, rim {syn['rim_pressure']:.1f}, ball-move {syn['ball_move']:.1f}, int D {syn['int_def']:.1f}, per D {syn['per_def']:.1f}, reb {syn['rebounding']:.1f}, pace {syn['pace']:.1f}")
 
-    def show_team(team: Team):
+    def show_team(team: Team, first_row: int):
         print(f"\n--- {team.name} Box ---")
-        for p in team.all_players():
-            r = result['box'].get(p.name, {})
-            pts = r.get('pts',0); fgm=r.get('fgm',0); fga=r.get('fga',0); ast=r.get('ast',0)
-            ftm=r.get('ftm',0); fta=r.get('fta',0); orb=r.get('orb',0); drb=r.get('drb',0)
+        for row, p in enumerate(team.all_players(), first_row):
+            r = result['box'][row]
+            pts = r[STAT_IDX['pts']]; fgm=r[STAT_IDX['fgm']]; fga=r[STAT_IDX['fga']]; ast=r[STAT_IDX['ast']]
+            ftm=r[STAT_IDX['ftm']]; fta=r[STAT_IDX['fta']]; orb=r[STAT_IDX['orb']]; drb=r[STAT_IDX['drb']]
             print(f"{p.name:22}  PTS {pts:2}  FG {fgm}-{fga}  FT {ftm}-{fta}  AST {ast:2}  REB {orb+drb:2} (O{orb}/D{drb})")
 
-    show_team(team_a)
-    show_team(team_b)
+    show_team(team_a, 0)
+    show_team(team_b, 5)
 
 # -----------------------------
 # Main
@@ -502,15 +785,21 @@ if __name__ == "__main__":
 
     def auto_pick(team_name: str, avail: List[Player]) -> Team:
         lineup = {}
+        avail_mask = np.zeros(len(PLAYER_DB), dtype=bool)
+        avail_mask[[p.idx for p in avail if p.idx >= 0]] = True
+        extra = [p for p in avail if p.idx < 0]  # added outside PLAYER_DB
         for pos in POSITIONS:
-            cands = list_by_position(pos, avail)
-            # score candidates by (overall offense + defense + fit proxy)
-            def score(p: Player):
-                r=p.ratings
-                return r['finishing']+r['three']+r['mid']+r['playmaking'] + r['per_def']+r['int_def'] + 0.5*r['rebounding']
-            best = max(cands, key=score)
+            # best candidate by AUTO_SCORE (overall offense + defense + fit proxy)
+            ids = np.asarray(POS_INDEX[pos])
+            ids = ids[avail_mask[ids]]
+            cands = [PLAYER_DB[ids[AUTO_SCORE[ids].argmax()]]] if len(ids) else []
+            best = max(cands + list_by_position(pos, extra), key=_auto_score)
             lineup[pos]=best
             avail.remove(best)
+            if best.idx >= 0:
+                avail_mask[best.idx] = False
+            else:
+                extra.remove(best)
         print(f"Auto-drafted {team_name}:")
         for k,v in lineup.items():
             print(f" - {k}: {v.name}")